@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import base64
+import hashlib
+import hmac
+import threading
 import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Annotated, Literal
 
 import jwt
+import orjson
 from fastapi import Depends, HTTPException, Security
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
@@ -36,30 +42,125 @@ def issue_token(*, sub: str, role: Role) -> str:
     return jwt.encode(payload, settings.auth_jwt_secret, algorithm="HS256")
 
 
+_SECRET = settings.auth_jwt_secret.encode("utf-8")
+
+
+def _b64url_decode(segment: str) -> bytes:
+    return base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _int_claim(claims: dict, name: str) -> int:
+    try:
+        return int(claims[name])
+    except (TypeError, ValueError, OverflowError) as e:
+        raise ValueError(f"{name} must be an integer") from e
+
+
+def _verify_hs256(token: str) -> dict:
+    # Per-request verification without PyJWT's generic algorithm dispatch: one-shot
+    # hmac.digest plus orjson. Applies the same checks jwt.decode did with
+    # algorithms=["HS256"], our audience and issuer. Raises ValueError on any failure.
+    if token.count(".") != 2:
+        raise ValueError("malformed token")
+    signing_input, _, sig_b64 = token.rpartition(".")
+    header_b64, _, payload_b64 = signing_input.partition(".")
+
+    header = orjson.loads(_b64url_decode(header_b64))
+    if not isinstance(header, dict) or header.get("alg") != "HS256":
+        raise ValueError("unsupported algorithm")
+    # We implement no JWS extensions, so any "crit" (RFC 7515 §4.1.11) or an
+    # unencoded payload (b64=false) is rejected, as is a non-string "kid".
+    if "crit" in header or header.get("b64", True) is False:
+        raise ValueError("unsupported critical header")
+    if "kid" in header and not isinstance(header["kid"], str):
+        raise ValueError("invalid kid")
+    expected = hmac.digest(_SECRET, signing_input.encode("utf-8"), "sha256")
+    if not hmac.compare_digest(expected, _b64url_decode(sig_b64)):
+        raise ValueError("signature mismatch")
+
+    claims = orjson.loads(_b64url_decode(payload_b64))
+    if not isinstance(claims, dict):
+        raise ValueError("payload is not an object")
+
+    now = time.time()
+    if "iat" in claims and _int_claim(claims, "iat") > now:
+        raise ValueError("token not yet valid (iat)")
+    if "nbf" in claims and _int_claim(claims, "nbf") > now:
+        raise ValueError("token not yet valid (nbf)")
+    if "exp" in claims and _int_claim(claims, "exp") <= now:
+        raise ValueError("token expired")
+
+    if claims.get("iss") != settings.auth_jwt_issuer:
+        raise ValueError("invalid issuer")
+    aud = claims.get("aud")
+    if isinstance(aud, str):
+        aud = [aud]
+    if not isinstance(aud, list) or not all(isinstance(a, str) for a in aud):
+        raise ValueError("invalid audience")
+    if settings.auth_jwt_audience not in aud:
+        raise ValueError("audience mismatch")
+    if "jti" in claims and not isinstance(claims["jti"], str):
+        raise ValueError("invalid jti")
+    return claims
+
+
 def _decode_token(token: str) -> dict:
     try:
-        return jwt.decode(
-            token,
-            settings.auth_jwt_secret,
-            algorithms=["HS256"],
-            audience=settings.auth_jwt_audience,
-            issuer=settings.auth_jwt_issuer,
-        )
-    except jwt.PyJWTError as e:
+        return _verify_hs256(token)
+    except ValueError as e:
         raise HTTPException(status_code=401, detail="Invalid token") from e
 
 
+# Verified principals keyed by token digest -> (principal, exp). Clients reuse a
+# token for many requests, so a hit skips signature verification and claim parsing.
+# Sync dependencies run in the threadpool, hence the lock.
+_PRINCIPAL_CACHE_MAX = 4096
+_principal_cache: OrderedDict[bytes, tuple[Principal, int]] = OrderedDict()
+_principal_cache_lock = threading.Lock()
+
+
+def _cached_principal(key: bytes) -> Principal | None:
+    with _principal_cache_lock:
+        cached = _principal_cache.get(key)
+        if cached is None:
+            return None
+        principal, exp = cached
+        if time.time() >= exp:
+            del _principal_cache[key]
+            return None
+        _principal_cache.move_to_end(key)
+        return principal
+
+
+def _cache_principal(key: bytes, principal: Principal, exp: int) -> None:
+    with _principal_cache_lock:
+        _principal_cache[key] = (principal, exp)
+        if len(_principal_cache) > _PRINCIPAL_CACHE_MAX:
+            _principal_cache.popitem(last=False)
+
+
 def get_principal(
     creds: Annotated[HTTPAuthorizationCredentials | None, Security(security)],
 ) -> Principal:
     if creds is None:
         raise HTTPException(status_code=401, detail="Missing bearer token")
-    claims = _decode_token(creds.credentials)
+    token = creds.credentials
+    key = hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+    principal = _cached_principal(key)
+    if principal is not None:
+        return principal
+
+    claims = _decode_token(token)
     role = claims.get("role")
     sub = claims.get("sub")
     if role not in ("producer", "consumer", "admin") or not isinstance(sub, str):
         raise HTTPException(status_code=401, detail="Invalid token claims")
-    return Principal(sub=sub, role=role)  # type: ignore[arg-type]
+    principal = Principal(sub=sub, role=role)  # type: ignore[arg-type]
+    # Only cache tokens that expire; exp is the one claim that changes validity over time.
+    exp = claims.get("exp")
+    if isinstance(exp, int):
+        _cache_principal(key, principal, exp)
+    return principal
 
 
 def require_roles(*roles: Role):
@@ -1,18 +1,39 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 from typing import AsyncGenerator
 
-from redis.asyncio import Redis
+from redis.asyncio import BlockingConnectionPool, Redis
 
 from app.settings import settings
 
 
-_redis: Redis | None = None
+logger = logging.getLogger(__name__)
+
+# One shared pool sized for concurrent pipelines/gathers. The blocking variant
+# waits for a free connection instead of erroring once the pool is exhausted.
+_pool = BlockingConnectionPool.from_url(
+    settings.redis_url,
+    max_connections=settings.redis_pool_size,
+    decode_responses=False,
+)
+_redis = Redis(connection_pool=_pool)
 
 
 async def get_redis() -> AsyncGenerator[Redis, None]:
-    global _redis
-    if _redis is None:
-        _redis = Redis.from_url(settings.redis_url, decode_responses=False)
     yield _redis
 
+
+async def warm_redis_pool() -> None:
+    # Open pool connections eagerly so the first burst of requests doesn't pay
+    # connection setup. Redis may not be up yet (compose start order); the pool
+    # then simply connects lazily.
+    try:
+        await asyncio.gather(*(_redis.ping() for _ in range(settings.redis_pool_size)))
+    except Exception:
+        logger.warning("Redis pool warm-up failed; connecting lazily", exc_info=True)
+
+
+async def close_redis_pool() -> None:
+    await _pool.disconnect()
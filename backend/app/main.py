@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import time
+from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from app.deps import close_redis_pool, warm_redis_pool
 from app.logging import configure_logging
 from app.metrics import HTTP_REQUEST_DURATION
 from app.routers import admin_routes, auth_routes, consumer_routes, metrics_routes, producer_routes
@@ -14,10 +17,39 @@ from app.settings import settings
 
 configure_logging()
 
+
+class PrometheusTimingMiddleware:
+    # Pure ASGI rather than @app.middleware("http"): BaseHTTPMiddleware adds a task
+    # and a memory stream per request, which dominates cheap endpoints.
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        # Avoid labeling high-cardinality paths; routers also use template labels.
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            HTTP_REQUEST_DURATION.labels(method=scope["method"], path="raw").observe(
+                time.perf_counter() - start
+            )
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    await warm_redis_pool()
+    yield
+    await close_redis_pool()
+
+
 app = FastAPI(
     title="OpenStream API",
     version="0.1.0",
     description="Open-source event streaming platform API (Redis Streams backbone).",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -27,19 +59,7 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
-
-
-@app.middleware("http")
-async def prometheus_timing(request: Request, call_next):
-    # Avoid labeling high-cardinality paths; routers also use template labels.
-    start = time.perf_counter()
-    resp = await call_next(request)
-    dur = time.perf_counter() - start
-    try:
-        HTTP_REQUEST_DURATION.labels(method=request.method, path="raw").observe(dur)
-    except Exception:
-        pass
-    return resp
+app.add_middleware(PrometheusTimingMiddleware)
 
 
 @app.get("/healthz")
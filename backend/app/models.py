@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Literal
+from typing import Annotated, Any, Literal
 
 from pydantic import BaseModel, Field
 
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - msgspec is in requirements; Pydantic still works
+    msgspec = None
+
 
 class EventIn(BaseModel):
     event_type: str = Field(min_length=1, max_length=200)
@@ -18,6 +23,21 @@ class IngestRequest(BaseModel):
     partitions: int | None = Field(default=None, ge=1, le=4096)
 
 
+if msgspec is not None:
+    # msgspec mirrors of EventIn/IngestRequest for the ingest hot path: decoding and
+    # validating a 5000-event batch is several times faster than with Pydantic.
+
+    class EventInStruct(msgspec.Struct):
+        event_type: Annotated[str, msgspec.Meta(min_length=1, max_length=200)]
+        partition_key: Annotated[str, msgspec.Meta(max_length=200)] | None = None
+        payload: dict[str, Any] = {}
+        timestamp_ms: int | None = None
+
+    class IngestRequestStruct(msgspec.Struct):
+        events: Annotated[list[EventInStruct], msgspec.Meta(min_length=1, max_length=5000)]
+        partitions: Annotated[int, msgspec.Meta(ge=1, le=4096)] | None = None
+
+
 class IngestedEvent(BaseModel):
     partition: int
     redis_id: str
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-import hashlib
-from dataclasses import dataclass
+import time
 from typing import Any
 
+import xxhash
 from redis.asyncio import Redis
 
+from app.redis_client_hot import xreadgroup_to_read_events
 from app.settings import settings
 
 
+# Settings are fixed for the life of the process; resolve the prefix once.
+_PREFIX = settings.redis_key_prefix
+
+
 def _key(*parts: str) -> str:
-    return ":".join((settings.redis_key_prefix, *parts))
+    return f"{_PREFIX}:{':'.join(parts)}"
 
 
 def topic_set_key() -> str:
@@ -22,58 +27,62 @@ def topic_meta_key(topic: str) -> str:
 
 
 def stream_key(topic: str, partition: int) -> str:
-    return _key("stream", topic, str(partition))
+    # Called per event/partition on hot paths; skip the generic join.
+    return f"{_PREFIX}:stream:{topic}:{partition}"
 
 
 def stable_partition(topic: str, partition_key: str, partitions: int) -> int:
     # Deterministic across processes; unlike Python's built-in hash().
-    digest = hashlib.sha256(f"{topic}:{partition_key}".encode("utf-8")).digest()
-    value = int.from_bytes(digest[:8], "big", signed=False)
-    return value % partitions
+    # Non-cryptographic on purpose: this only spreads keys over partitions.
+    return xxhash.xxh64_intdigest(f"{topic}:{partition_key}") % partitions
 
 
-@dataclass(frozen=True)
-class StreamMessage:
-    stream: str
-    message_id: str
-    fields: dict[str, str]
+# Per-process cache of topic partition counts: topic -> (partitions, fetched_at).
+# Saves an HGET on every request for hot topics; entries expire after a short TTL
+# so changes made by other API processes are picked up quickly.
+_PARTITIONS_CACHE_TTL_S = 5.0
+_PARTITIONS_CACHE_MAX = 4096
+_partitions_cache: dict[str, tuple[int, float]] = {}
 
 
 async def ensure_topic(redis: Redis, *, topic: str, partitions: int) -> None:
     # Track topics and partition count so the UI/summary can discover them.
-    await redis.sadd(topic_set_key(), topic)
-    await redis.hsetnx(topic_meta_key(topic), "partitions", str(partitions))
+    # redis-py types async replies as `Awaitable[T] | T`; mypyc's checker needs the ignores.
+    await redis.sadd(topic_set_key(), topic)  # type: ignore[misc]
+    created = await redis.hsetnx(topic_meta_key(topic), "partitions", str(partitions))  # type: ignore[misc]
+    # Only a successful HSETNX changes the stored count; otherwise the cache is still right.
+    if created:
+        _cache_partitions(topic, partitions, time.monotonic())
+
+
+def _cache_partitions(topic: str, partitions: int, now: float) -> None:
+    # Re-insert so dict order tracks recency; evict the least recently used entry when full.
+    _partitions_cache.pop(topic, None)
+    if len(_partitions_cache) >= _PARTITIONS_CACHE_MAX:
+        _partitions_cache.pop(next(iter(_partitions_cache)))
+    _partitions_cache[topic] = (partitions, now)
 
 
 async def get_topic_partitions(redis: Redis, *, topic: str) -> int:
-    raw = await redis.hget(topic_meta_key(topic), "partitions")
+    now = time.monotonic()
+    cached = _partitions_cache.get(topic)
+    if cached is not None and now - cached[1] < _PARTITIONS_CACHE_TTL_S:
+        # Move to the end so hot topics aren't the first evicted.
+        del _partitions_cache[topic]
+        _partitions_cache[topic] = cached
+        return cached[0]
+
+    raw = await redis.hget(topic_meta_key(topic), "partitions")  # type: ignore[misc]
     if raw is None:
+        # Don't cache the default: another process may be about to create the topic.
         return settings.partitions_default
     try:
-        return int(raw)
+        partitions = int(raw)
     except ValueError:
         return settings.partitions_default
 
-
-def _decode_fields(fields: dict[bytes, bytes]) -> dict[str, str]:
-    return {k.decode("utf-8"): v.decode("utf-8") for k, v in fields.items()}
-
-
-def _coerce_xreadgroup(
-    res: list[tuple[bytes, list[tuple[bytes, dict[bytes, bytes]]]]]
-) -> list[StreamMessage]:
-    out: list[StreamMessage] = []
-    for stream_b, msgs in res:
-        stream = stream_b.decode("utf-8")
-        for msg_id_b, fields_b in msgs:
-            out.append(
-                StreamMessage(
-                    stream=stream,
-                    message_id=msg_id_b.decode("utf-8"),
-                    fields=_decode_fields(fields_b),
-                )
-            )
-    return out
+    _cache_partitions(topic, partitions, now)
+    return partitions
 
 
 async def xreadgroup_multi(
@@ -81,19 +90,20 @@ async def xreadgroup_multi(
     *,
     group: str,
     consumer: str,
-    streams: dict[str, str],
+    stream_partitions: dict[bytes, int],
     count: int,
     block_ms: int,
-) -> list[StreamMessage]:
-    # redis-py expects stream names as bytes/str; we pass str.
+) -> list[dict[str, Any]]:
+    # Reads new entries (">") from every stream in stream_partitions. Keys are bytes
+    # because that's how the reply names streams; no per-message key parsing needed.
     res = await redis.xreadgroup(
         groupname=group,
         consumername=consumer,
-        streams=streams,
+        streams=dict.fromkeys(stream_partitions, ">"),
         count=count,
         block=block_ms if block_ms > 0 else None,
     )
-    return _coerce_xreadgroup(res)
+    return xreadgroup_to_read_events(res, stream_partitions)
 
 
 async def xinfo_groups_safe(redis: Redis, *, stream: str) -> list[dict[str, Any]]:
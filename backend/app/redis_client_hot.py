@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import Any
+
+# Per-message decoding for the read path. Kept stdlib-only and fully annotated so
+# it can be compiled with mypyc (see setup.py); without the compiled extension
+# Python simply imports this file.
+
+
+def _opt_str(value: bytes | None) -> str | None:
+    return value.decode("utf-8") if value is not None else None
+
+
+def xreadgroup_to_read_events(res: list[Any], stream_partitions: dict[bytes, int]) -> list[dict[str, Any]]:
+    # Single pass from the raw XREADGROUP reply to ReadEvent-shaped dicts.
+    # redis-py yields [stream, [(id, fields), ...]] per stream (lists, not tuples).
+    out: list[dict[str, Any]] = []
+    for item in res:
+        stream_b: bytes = item[0]
+        msgs: list[tuple[bytes, dict[bytes, bytes]]] = item[1]
+        partition = stream_partitions[stream_b]
+        for msg_id_b, fields_b in msgs:
+            ts = fields_b.get(b"timestamp_ms")
+            out.append(
+                {
+                    "partition": partition,
+                    "redis_id": msg_id_b.decode("utf-8"),
+                    "event_type": _opt_str(fields_b.get(b"event_type")),
+                    "payload_json": _opt_str(fields_b.get(b"payload_json")),
+                    "timestamp_ms": int(ts) if ts is not None else None,
+                    "partition_key": _opt_str(fields_b.get(b"partition_key")),
+                }
+            )
+    return out
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import time
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request
@@ -15,6 +17,9 @@ from app.settings import settings
 
 router = APIRouter(prefix="/v1/topics", tags=["admin"])
 
+_T_GROUP_CREATE = HTTP_REQUEST_DURATION.labels(method="POST", path="/v1/topics/{topic}/groups")
+_T_GROUP_RESET = HTTP_REQUEST_DURATION.labels(method="POST", path="/v1/topics/{topic}/groups/{group}/reset")
+
 
 @router.post("/{topic}/groups")
 async def create_group(
@@ -24,20 +29,23 @@ async def create_group(
     _p: Annotated[Principal, Depends(require_roles("admin"))],
     redis: Annotated[Redis, Depends(get_redis)],
 ):
-    with HTTP_REQUEST_DURATION.labels(method="POST", path="/v1/topics/{topic}/groups").time():
+    _t0 = time.perf_counter()
+    try:
         partitions = req.partitions or await get_topic_partitions(redis, topic=topic)
         await ensure_topic(redis, topic=topic, partitions=partitions)
-        created = 0
-        for p in range(partitions):
-            skey = stream_key(topic, p)
-            try:
-                # mkstream=True creates stream if doesn't exist yet.
-                await redis.xgroup_create(name=skey, groupname=req.group, id=req.start_id, mkstream=True)
-                created += 1
-            except Exception:
-                # BUSYGROUP or other errors; treat as already created.
-                continue
+        # mkstream=True creates stream if doesn't exist yet.
+        results = await asyncio.gather(
+            *(
+                redis.xgroup_create(name=stream_key(topic, p), groupname=req.group, id=req.start_id, mkstream=True)
+                for p in range(partitions)
+            ),
+            return_exceptions=True,
+        )
+        # BUSYGROUP or other errors; treat as already created.
+        created = sum(1 for r in results if not isinstance(r, BaseException))
         return {"topic": topic, "group": req.group, "partitions": partitions, "created": created}
+    finally:
+        _T_GROUP_CREATE.observe(time.perf_counter() - _t0)
 
 
 @router.post("/{topic}/groups/{group}/reset")
@@ -53,21 +61,22 @@ async def reset_group(
     Reset a consumer group's offset for replay.
     Equivalent to: XGROUP SETID <stream> <group> <start_id>
     """
-    with HTTP_REQUEST_DURATION.labels(
-        method="POST", path="/v1/topics/{topic}/groups/{group}/reset"
-    ).time():
+    _t0 = time.perf_counter()
+    try:
         partitions = await get_topic_partitions(redis, topic=topic)
-        updated = 0
-        for p in range(partitions):
-            skey = stream_key(topic, p)
-            try:
-                await redis.xgroup_setid(name=skey, groupname=group, id=req.start_id)
-                updated += 1
-            except Exception:
-                continue
+        results = await asyncio.gather(
+            *(
+                redis.xgroup_setid(name=stream_key(topic, p), groupname=group, id=req.start_id)
+                for p in range(partitions)
+            ),
+            return_exceptions=True,
+        )
+        updated = sum(1 for r in results if not isinstance(r, BaseException))
         if updated == 0:
             raise HTTPException(status_code=404, detail="Group not found on any partition")
         return {"topic": topic, "group": group, "start_id": req.start_id, "updated_partitions": updated}
+    finally:
+        _T_GROUP_RESET.observe(time.perf_counter() - _t0)
 
 
 @router.get("/{topic}/describe")
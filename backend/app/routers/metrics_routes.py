@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Annotated, Any
+import asyncio
+import time
+from typing import Annotated, Any, Awaitable, TypeVar
 
 from fastapi import APIRouter, Depends, Request
 from redis.asyncio import Redis
@@ -13,6 +15,18 @@ from app.redis_client import get_topic_partitions, stream_key, topic_set_key, xi
 
 router = APIRouter(prefix="/v1/metrics", tags=["metrics"])
 
+_T_SUMMARY = HTTP_REQUEST_DURATION.labels(method="GET", path="/v1/metrics/summary")
+
+# Max in-flight Redis commands per summary request.
+_SUMMARY_CONCURRENCY = 32
+
+T = TypeVar("T")
+
+
+async def _bounded(sem: asyncio.Semaphore, aw: Awaitable[T]) -> T:
+    async with sem:
+        return await aw
+
 
 @router.get("/summary")
 async def metrics_summary(
@@ -24,24 +38,39 @@ async def metrics_summary(
     UI-friendly JSON summary (fast-ish, not exhaustive).
     Prometheus remains the source of truth for time-series history.
     """
-    with HTTP_REQUEST_DURATION.labels(method="GET", path="/v1/metrics/summary").time():
+    _t0 = time.perf_counter()
+    try:
         topics_b = await redis.smembers(topic_set_key())
         topics = sorted([t.decode("utf-8") if isinstance(t, bytes) else str(t) for t in topics_b])
 
+        # Dispatch per-topic/per-partition lookups concurrently, capped so a
+        # large keyspace doesn't exhaust the Redis connection pool.
+        sem = asyncio.Semaphore(_SUMMARY_CONCURRENCY)
+        partition_counts = await asyncio.gather(
+            *(_bounded(sem, get_topic_partitions(redis, topic=topic)) for topic in topics)
+        )
+        skeys = [
+            [stream_key(topic, p) for p in range(partitions)]
+            for topic, partitions in zip(topics, partition_counts)
+        ]
+        flat = [skey for topic_skeys in skeys for skey in topic_skeys]
+        lengths, groups = await asyncio.gather(
+            asyncio.gather(*(_bounded(sem, redis.xlen(skey)) for skey in flat)),
+            asyncio.gather(*(_bounded(sem, xinfo_groups_safe(redis, stream=skey)) for skey in flat)),
+        )
+
+        stats = iter(zip(lengths, groups))
         topic_stats: list[dict[str, Any]] = []
-        for topic in topics:
-            partitions = await get_topic_partitions(redis, topic=topic)
+        for topic, partitions, topic_skeys in zip(topics, partition_counts, skeys):
             partitions_stats: list[dict[str, Any]] = []
-            for p in range(partitions):
-                skey = stream_key(topic, p)
-                length = await redis.xlen(skey)
-                groups = await xinfo_groups_safe(redis, stream=skey)
+            for p, skey in enumerate(topic_skeys):
+                length, stream_groups = next(stats)
                 partitions_stats.append(
                     {
                         "partition": p,
                         "stream": skey,
                         "length": int(length),
-                        "groups": groups,
+                        "groups": stream_groups,
                     }
                 )
             topic_stats.append({"topic": topic, "partitions": partitions, "partition_stats": partitions_stats})
@@ -55,4 +84,6 @@ async def metrics_summary(
             "topics": topic_stats,
             "redis": {"used_memory": used_memory, "used_memory_human": used_memory_human},
         }
+    finally:
+        _T_SUMMARY.observe(time.perf_counter() - _t0)
 
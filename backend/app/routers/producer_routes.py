@@ -1,9 +1,16 @@
 from __future__ import annotations
 
+import inspect
 import json
-from typing import Annotated
+import math
+import time
+from typing import Annotated, Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import ValidationError
 from redis.asyncio import Redis
 
 from app.auth import Principal, require_roles
@@ -14,46 +21,170 @@ from app.metrics import (
     INGEST_EVENTS_TOTAL,
     INGEST_REQUESTS_TOTAL,
 )
-from app.models import IngestRequest, IngestResponse, IngestedEvent
+from app.models import IngestRequest, IngestResponse, msgspec
 from app.redis_client import ensure_topic, get_topic_partitions, stable_partition, stream_key
 from app.settings import settings
 
 
 router = APIRouter(prefix="/v1/topics", tags=["producers"])
 
+_T_INGEST = HTTP_REQUEST_DURATION.labels(method="POST", path="/v1/topics/{topic}/events")
+_REQUESTS_OK = INGEST_REQUESTS_TOTAL.labels(status="ok")
+_REQUESTS_ERROR = INGEST_REQUESTS_TOTAL.labels(status="error")
+_REQUESTS_BACKPRESSURE = INGEST_REQUESTS_TOTAL.labels(status="backpressure")
 
-@router.post("/{topic}/events", response_model=IngestResponse)
+# XADD field names/values are built as bytes so redis-py sends them without re-encoding.
+_F_EVENT_TYPE = b"event_type"
+_F_PAYLOAD_JSON = b"payload_json"
+_F_TIMESTAMP_MS = b"timestamp_ms"
+_F_PARTITION_KEY = b"partition_key"
+
+
+def _has_non_finite(value: Any) -> bool:
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, list):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def _dumps_payload(payload: dict[str, Any]) -> bytes:
+    # Compact UTF-8 JSON, stored in the stream as-is (redis-py sends bytes untouched).
+    try:
+        out = orjson.dumps(payload)
+    except orjson.JSONEncodeError:
+        # orjson rejects ints wider than 64 bits; keep accepting them via stdlib json.
+        out = None
+    # orjson also writes NaN/Infinity as null without raising; only scan the payload
+    # when the output contains a null at all.
+    if out is None or (b"null" in out and _has_non_finite(payload)):
+        return json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return out
+
+
+if msgspec is not None:
+    from app.models import IngestRequestStruct
+
+    # Strict, so only canonical JSON types take the fast path; anything else goes
+    # through Pydantic below.
+    _ingest_decoder = msgspec.json.Decoder(IngestRequestStruct)
+else:  # pragma: no cover
+    IngestRequestStruct = IngestRequest  # type: ignore[misc,assignment]
+
+
+def _validate_ingest_request(body: bytes) -> IngestRequest:
+    try:
+        return IngestRequest.model_validate_json(body)
+    except ValidationError as e:
+        errors = [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body) from e
+
+
+async def _parse_ingest_request(request: Request) -> IngestRequest | IngestRequestStruct:
+    # Decode the body ourselves instead of declaring `req: IngestRequest`, so the
+    # batch is validated by msgspec rather than Pydantic. Errors surface as the
+    # usual 422 validation response.
+    body = await request.body()
+    if msgspec is None:
+        return _validate_ingest_request(body)
+    try:
+        return _ingest_decoder.decode(body)
+    except msgspec.DecodeError:
+        # Malformed JSON, a failed constraint, or a lax input such as "123" for
+        # timestamp_ms. Pydantic decides, so coercions and error details (type,
+        # field-level loc) are exactly those of the IngestRequest model.
+        return _validate_ingest_request(body)
+
+
+def _inline_defs(node: Any, defs: dict[str, Any]) -> Any:
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and ref.startswith("#/$defs/"):
+            return _inline_defs(defs[ref.rsplit("/", 1)[-1]], defs)
+        return {k: _inline_defs(v, defs) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_inline_defs(v, defs) for v in node]
+    return node
+
+
+def _ingest_request_openapi() -> dict[str, Any]:
+    # The body isn't a declared parameter anymore; keep it documented in /docs.
+    schema = IngestRequest.model_json_schema()
+    schema = _inline_defs(schema, schema.pop("$defs", {}))
+    return {"requestBody": {"required": True, "content": {"application/json": {"schema": schema}}}}
+
+
+@router.post(
+    "/{topic}/events",
+    # Serialized straight from dicts with orjson; IngestResponse only documents the shape.
+    response_class=ORJSONResponse,
+    responses={200: {"model": IngestResponse}},
+    openapi_extra=_ingest_request_openapi(),
+)
 async def ingest_events(
     topic: str,
-    req: IngestRequest,
-    request: Request,
+    # Auth first: FastAPI resolves dependencies in parameter order, and the body
+    # shouldn't be decoded (or its 422 shown) for unauthenticated callers.
     _p: Annotated[Principal, Depends(require_roles("producer", "admin"))],
+    req: Annotated[IngestRequest | IngestRequestStruct, Depends(_parse_ingest_request)],
+    request: Request,
     redis: Annotated[Redis, Depends(get_redis)],
-) -> IngestResponse:
-    with HTTP_REQUEST_DURATION.labels(method="POST", path="/v1/topics/{topic}/events").time():
+) -> ORJSONResponse:
+    _t0 = time.perf_counter()
+    try:
         partitions = req.partitions or await get_topic_partitions(redis, topic=topic)
         await ensure_topic(redis, topic=topic, partitions=partitions)
 
-        results: list[IngestedEvent] = []
+        results: list[dict[str, Any]] = []
 
         # Hot path: append-only XADD; ensure ordering per partition.
         try:
+            # Resolve partitions and build XADD fields up-front so the Redis
+            # round trips below can be pipelined instead of awaited per event.
+            # Keys and tallies are per touched partition, in first-seen order.
+            skeys: dict[int, str] = {}
+            event_counts: dict[int, int] = {}
+            byte_counts: dict[int, int] = {}
+            batch: list[tuple[int, dict[bytes, bytes]]] = []
             for ev in req.events:
                 pkey = ev.partition_key or ""
                 partition = stable_partition(topic, pkey, partitions)
-                skey = stream_key(topic, partition)
-
-                # Backpressure (simple): cap stream length to avoid unbounded growth
-                # if retention/consumption is misconfigured.
-                if settings.backpressure_max_stream_len > 0:
-                    length = await redis.xlen(skey)
-                    if length >= settings.backpressure_max_stream_len:
-                        INGEST_REQUESTS_TOTAL.labels(status="backpressure").inc()
+                if partition not in skeys:
+                    skeys[partition] = stream_key(topic, partition)
+                    event_counts[partition] = 0
+                    byte_counts[partition] = 0
+
+                payload_json = _dumps_payload(ev.payload)
+                fields = {_F_EVENT_TYPE: ev.event_type.encode("utf-8"), _F_PAYLOAD_JSON: payload_json}
+                if ev.timestamp_ms is not None:
+                    fields[_F_TIMESTAMP_MS] = b"%d" % ev.timestamp_ms
+                if ev.partition_key is not None:
+                    fields[_F_PARTITION_KEY] = ev.partition_key.encode("utf-8")
+
+                batch.append((partition, fields))
+                event_counts[partition] += 1
+                byte_counts[partition] += len(payload_json)
+
+            # Backpressure (simple): cap stream length to avoid unbounded growth
+            # if retention/consumption is misconfigured. One XLEN per touched partition;
+            # the whole batch is rejected before any XADD so it is never partially written.
+            max_len = settings.backpressure_max_stream_len
+            if max_len > 0:
+                pipe = redis.pipeline(transaction=False)
+                for skey in skeys.values():
+                    pipe.xlen(skey)
+                lengths = await pipe.execute()
+
+                for partition, length in zip(skeys, lengths):
+                    if length + event_counts[partition] > max_len:
+                        _REQUESTS_BACKPRESSURE.inc()
                         raise HTTPException(
                             status_code=429,
                             detail={
                                 "error": "backpressure",
-                                "message": "Stream is at/over max length; consumers are too slow or retention too high.",
+                                "message": "Stream would exceed max length; consumers are too slow or retention too high.",
                                 "topic": topic,
                                 "partition": partition,
                                 "stream_len": length,
@@ -61,30 +192,34 @@ async def ingest_events(
                             headers={"Retry-After": "1"},
                         )
 
-                payload_json = json.dumps(ev.payload, separators=(",", ":"), ensure_ascii=False)
-                fields = {
-                    "event_type": ev.event_type,
-                    "payload_json": payload_json,
-                }
-                if ev.timestamp_ms is not None:
-                    fields["timestamp_ms"] = str(ev.timestamp_ms)
-                if ev.partition_key is not None:
-                    fields["partition_key"] = ev.partition_key
+            pipe = redis.pipeline(transaction=False)
+            for partition, fields in batch:
+                pipe.xadd(skeys[partition], fields)
+            redis_ids = await pipe.execute()
 
-                redis_id = await redis.xadd(skey, fields)
+            for (partition, _), redis_id in zip(batch, redis_ids):
                 # redis-py returns bytes when decode_responses=False
                 if isinstance(redis_id, bytes):
                     redis_id = redis_id.decode("utf-8")
 
-                results.append(IngestedEvent(partition=partition, redis_id=redis_id))
-                INGEST_EVENTS_TOTAL.labels(topic=topic, partition=str(partition)).inc()
-                INGEST_BYTES_TOTAL.labels(topic=topic, partition=str(partition)).inc(len(payload_json))
+                results.append({"partition": partition, "redis_id": redis_id})
+
+            # Resolve each labeled counter once per batch rather than per event.
+            for partition in skeys:
+                INGEST_EVENTS_TOTAL.labels(topic=topic, partition=str(partition)).inc(event_counts[partition])
+                INGEST_BYTES_TOTAL.labels(topic=topic, partition=str(partition)).inc(byte_counts[partition])
 
-            INGEST_REQUESTS_TOTAL.labels(status="ok").inc()
-            return IngestResponse(topic=topic, partitions=partitions, results=results)
+            _REQUESTS_OK.inc()
+            return ORJSONResponse({"topic": topic, "partitions": partitions, "results": results})
         except HTTPException:
             raise
         except Exception as e:
-            INGEST_REQUESTS_TOTAL.labels(status="error").inc()
+            _REQUESTS_ERROR.inc()
             raise HTTPException(status_code=500, detail="Ingestion failed") from e
+    finally:
+        _T_INGEST.observe(time.perf_counter() - _t0)
+
 
+_ingest_params = list(inspect.signature(ingest_events).parameters)
+if _ingest_params.index("_p") > _ingest_params.index("req"):  # pragma: no cover
+    raise RuntimeError("ingest_events must declare its auth dependency before the request body")
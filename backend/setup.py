@@ -0,0 +1,21 @@
+# Build-time only: compiles the hot-path modules listed below to C extensions
+# with mypyc. The app runs unchanged from source when they aren't built.
+#
+#   pip install -r requirements.txt -r requirements-build.txt
+#   python setup.py build_ext --inplace
+#
+# auth.py is left out on purpose: FastAPI introspects its dependency functions
+# (signatures/annotations), which compiled functions don't expose.
+from mypyc.build import mypycify
+from setuptools import setup
+
+
+MODULES = ["app/redis_client_hot.py", "app/redis_client.py"]
+
+setup(
+    name="openstream-backend",
+    packages=["app"],
+    # One group with a fixed name, so the shared runtime library is always
+    # openstream__mypyc.*.so (written next to app/).
+    ext_modules=mypycify(MODULES, separate=[(MODULES, "openstream")]),
+)